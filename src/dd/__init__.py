@@ -1,4 +1,4 @@
-from .dd import dd, DDException
+from .dd import dd, dd_map, dd_where, DDException
 
-__all__ = ["dd", "DDException"]
+__all__ = ["dd", "dd_map", "dd_where", "DDException"]
 
@@ -1,137 +1,698 @@
-from typing import Any, Callable, TypeVar, Optional, List, Union
+import sys
+import textwrap
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, TypeVar, Optional, List, Sequence, Tuple, Union
 
 _R = TypeVar("_R")  # Return type for converters
 
+# Operation tags, dd.__call__ dispatches on these instead of calling apply() for every step
+_OP_ATTR = 0
+_OP_ITEM = 1
+_OP_EXPAND = 2
+_OP_MAP = 3
+_OP_FUSED = 4
+_OP_FILTER = 5
+
+# Sentinel for lookups that found nothing, None is a legitimate value
+_MISSING = object()
+
+# The runner of a chain without [...] that was called once, it is compiled if called again
+_CALLED_ONCE = object()
+
+# Unbound C method, calling it skips creating a bound method on every lookup
+_dict_get = dict.get
+
+# Containers that can be iterated again. [...] recognises them by exact type,
+# and a compiled chain may only consume these
+_REITERABLE_TYPES = frozenset((list, tuple, set, frozenset, range))
+
+# [...] by exact type, anything else goes through the isinstance checks
+_EXPAND_DISPATCH: Dict[type, Callable[[Any], List[Any]]] = {t: list for t in _REITERABLE_TYPES}
+_EXPAND_DISPATCH[dict] = lambda value: list(value.values())
+
+# Keys whose equal values are interchangeable once the type matches, (1, 1) == (True, 1) and
+# 0.0 == -0.0 are not. Only these keys share item operations
+_SHARED_KEY_TYPES = frozenset((int, bool, str, bytes, type(None)))
+
 
 class DDException(Exception):
     """Custom exception class for beautifying error messages in DD operations"""
 
     def __init__(self, message: str, path: List[str], value: Any):
         self.message: str = message
-        self.path: List[str] = path
+        # Operations raise with their own path entries only, each enclosing
+        # step prepends its part while the exception propagates
+        self.path: List[str] = list(path)
         self.value: Any = value
-        super().__init__(f"{message} at full path: {'.'.join(path)}, from value: {repr(value)}")
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        # Formatted on demand, repr() of a large value is only paid when the error is shown
+        return f"{self.message} at full path: {'.'.join(self.path)}, from value: {repr(self.value)}"
 
 
 class _DDOperation:
     """Base class to record DD operations"""
 
-    def apply(self, value: Any, path: List[str]) -> Any:
+    __slots__ = ()
+
+    opcode: int = -1
+    token: Optional[str] = None  # Entry this operation adds to an error path, None if it adds none
+
+    def apply(self, value: Any) -> Any:
+        raise NotImplementedError()
+
+    def signature(self) -> Tuple[Any, ...]:
+        """Hashable description of the operation, used to cache compiled chains"""
         raise NotImplementedError()
 
 
 class _DDAttributeOperation(_DDOperation):
     """Operation to get an attribute"""
 
+    __slots__ = ("attr", "key", "null_safe", "token")
+
+    opcode = _OP_ATTR
+
     def __init__(self, attr: str, null_safe: bool):
-        self.attr: str = attr
+        self.attr: str = sys.intern(attr)
+        self.key: str = self.attr  # Subscript key, shared with item operations so lookups need no type check
         self.null_safe: bool = null_safe
+        self.token: str = self.attr  # Path entry for this operation
+
+    def signature(self) -> Tuple[Any, ...]:
+        # The name is bound when the chain is compiled, every name shares the generated code
+        return (_OP_ATTR, self.null_safe)
 
-    def apply(self, value: Any, path: List[str]) -> Any:
-        path.append(self.attr)
+    def apply(self, value: Any) -> Any:
         if value is None and self.null_safe:
             return None
+        if type(value) is dict:
+            # Look before leaping on plain dicts, a null-safe miss then costs no exception
+            result = _dict_get(value, self.attr, _MISSING)
+            if result is not _MISSING:
+                return result
+            if self.null_safe:
+                return None
         try:
             return value[self.attr]
         except KeyError as e:
             if self.null_safe:
                 return None
-            raise DDException(f"Failed to get attribute '{self.attr}': {str(e)}", path, value) from e
+            raise DDException(f"Failed to get attribute '{self.attr}': {str(e)}", [self.token], value) from e
         except IndexError as e:
             if self.null_safe:
                 return None
-            raise DDException(f"Failed to get attribute '{self.attr}': {str(e)}", path, value) from e
+            raise DDException(f"Failed to get attribute '{self.attr}': {str(e)}", [self.token], value) from e
         except Exception as e:
-            raise DDException(f"Failed to get attribute '{self.attr}': {str(e)}", path, value) from e
+            raise DDException(f"Failed to get attribute '{self.attr}': {str(e)}", [self.token], value) from e
 
 
 class _DDItemOperation(_DDOperation):
     """Operation to get an item by index/key"""
 
+    __slots__ = ("key", "null_safe", "index")
+
+    opcode = _OP_ITEM
+
     def __init__(self, key: Any, null_safe: bool):
         self.key: Any = key
         self.null_safe: bool = null_safe
+        # Plain int keys get the bounds-checked sequence path, decided once instead of per value
+        self.index: bool = type(key) is int
 
-    def apply(self, value: Any, path: List[str]) -> Any:
-        path.append(f"[{repr(self.key)}]")
+    @property
+    def token(self) -> str:
+        """Path entry for this operation, only an error path needs the key's repr()"""
+        return f"[{repr(self.key)}]"
+
+    def signature(self) -> Tuple[Any, ...]:
+        # The key is bound when the chain is compiled, every key shares the generated code
+        return (_OP_ITEM, self.null_safe)
+
+    def apply(self, value: Any) -> Any:
         if value is None and self.null_safe:
             return None
+        t = type(value)
+        if self.index and (t is list or t is tuple):
+            # Bounds check instead of catching IndexError for plain sequences
+            n = len(value)
+            if -n <= self.key < n:
+                return value[self.key]
+            if self.null_safe:
+                return None
         try:
+            if t is dict:
+                # Inside the try only because an unhashable key makes dict.get raise TypeError
+                result = _dict_get(value, self.key, _MISSING)
+                if result is not _MISSING:
+                    return result
+                if self.null_safe:
+                    return None
             return value[self.key]
         except KeyError as e:
             if self.null_safe:
                 return None
-            raise DDException(f"Failed to get attribute '{self.key}': {str(e)}", path, value) from e
+            raise DDException(f"Failed to get attribute '{self.key}': {str(e)}", [self.token], value) from e
         except IndexError as e:
             if self.null_safe:
                 return None
-            raise DDException(f"Failed to get attribute '{self.key}': {str(e)}", path, value) from e
+            raise DDException(f"Failed to get attribute '{self.key}': {str(e)}", [self.token], value) from e
         except Exception as e:
-            raise DDException(f"Failed to get item with key '{self.key}': {str(e)}", path, value) from e
+            raise DDException(f"Failed to get item with key '{self.key}': {str(e)}", [self.token], value) from e
 
 
 class _DDExpandOperation(_DDOperation):
     """Expansion operation [...]"""
 
-    def apply(self, value: Any, path: List[str]) -> List[Any]:
-        path.append("[...]")
+    __slots__ = ()
+
+    opcode = _OP_EXPAND
+    token = "[...]"
+
+    def signature(self) -> Tuple[Any, ...]:
+        return (_OP_EXPAND,)
+
+    def apply(self, value: Any) -> List[Any]:
         if value is None:
             return []
+        expand = _dict_get(_EXPAND_DISPATCH, type(value))
         try:
-            if isinstance(value, dict):
+            if expand is not None:
+                return expand(value)
+            elif isinstance(value, dict):
                 return list(value.values())
-            elif hasattr(value, "__iter__") and not isinstance(value, (str, bytes)):
+            elif isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+                # The ABC check caches its answer per type, unlike hasattr() per value
                 return list(value)
             else:
-                raise DDException("Cannot expand non-iterable", path, value)
+                raise DDException("Cannot expand non-iterable", [self.token], value)
+        except DDException:
+            raise
         except Exception as e:
-            if isinstance(e, DDException):
-                raise
-            raise DDException(f"Failed to expand: {str(e)}", path, value) from e
+            raise DDException(f"Failed to expand: {str(e)}", [self.token], value) from e
+
+    def apply_mapped(self, value: Any, map_op: "_DDMapOperation") -> List[Any]:
+        """[...] directly followed by map_op, maps over the elements without building the expanded list"""
+        t = type(value)
+        if t is dict:
+            items: Iterable = value.values()
+        elif t in _REITERABLE_TYPES:
+            items = value
+        else:
+            # Other iterables may fail halfway, materialize them first so the failure is reported as an expand error
+            items = self.apply(value)
+        try:
+            return map_op.apply_each(items)
+        except DDException as e:
+            e.path.insert(0, self.token)
+            raise
 
 
 class _DDMapOperation(_DDOperation):
-    """Mapping operation, apply operations to each element in a list"""
+    """Mapping operation, apply an operation to each element of lists nested depth levels deep"""
 
-    def __init__(self, operation: _DDOperation, expansion_level: int = 1):
+    __slots__ = ("operation", "depth")
+
+    opcode = _OP_MAP
+
+    def __init__(self, operation: _DDOperation, depth: int = 1):
         self.operation: _DDOperation = operation
-        self.expansion_level: int = expansion_level  # Current expansion level for this mapping operation
+        # Number of expansion levels mapped over, one operation instead of a tower of nested maps
+        self.depth: int = depth
+
+    def signature(self) -> Tuple[Any, ...]:
+        return (_OP_MAP, self.depth, self.operation.signature())
+
+    def apply(self, value: Any) -> List[Any]:
+        try:
+            if type(value) is list:
+                return self._each(value, self.depth)
+            return self._map(value, self.depth)
+        except DDException:
+            if self.operation.opcode != _OP_FUSED:
+                raise
+        # Outside the handler, the error reported is the step-by-step one, not chained to the fused one
+        return self._apply_unfused(value, _DDMapOperation.apply)
 
-    def apply(self, value: Any, path: List[str]) -> List[Any]:
+    def apply_each(self, items: Iterable) -> List[Any]:
+        """Apply the mapping to every element of items"""
+        try:
+            return self._each(items, self.depth)
+        except DDException:
+            if self.operation.opcode != _OP_FUSED:
+                raise
+        return self._apply_unfused(items, _DDMapOperation.apply_each)
+
+    def _apply_unfused(self, value: Any, first: Callable[["_DDMapOperation", Any], List[Any]]) -> List[Any]:
+        """Map the fused steps one after another, as if they had never been fused
+
+        A fused run takes each element through all of its steps before the next element, so
+        with several failing elements it fails on a different one than mapping step by step.
+        Replaying unfused reports the same element and path as separate maps would.
+        """
+        steps = self.operation.operations
+        value = first(_DDMapOperation(steps[0], self.depth), value)
+        for op in steps[1:]:
+            value = _DDMapOperation(op, self.depth).apply(value)
+        return value
+
+    def _map(self, value: Any, depth: int) -> List[Any]:
         if value is None:
             return []
 
         # If not a list, treat as a single-element list
-        if not isinstance(value, list):
-            result = self.operation.apply(value, path)
-            return [result]
+        if type(value) is not list and not isinstance(value, list):
+            return [self.operation.apply(value) if depth == 1 else self._map(value, depth - 1)]
+
+        return self._each(value, depth)
+
+    def _each(self, items: Iterable, depth: int) -> List[Any]:
+        op_apply = self.operation.apply
+        try:
+            # Fast paths: comprehensions only, the index is only looked for if an element fails
+            if depth == 1:
+                return [op_apply(item) for item in items]
+            if depth == 2:
+                return [
+                    [op_apply(inner) for inner in item]
+                    if type(item) is list or isinstance(item, list)
+                    else ([] if item is None else [op_apply(item)])
+                    for item in items
+                ]
+            map_below = self._map
+            below = depth - 1
+            return [map_below(item, below) for item in items]
+        except Exception:
+            pass  # Replay element by element below to report the failing index
 
         result: List[Any] = []
-        for i, item in enumerate(value):
-            item_path = path + [f"[{i}]"]
-            # If the operation itself is another _DDMapOperation, need to consider expansion level
-            if isinstance(self.operation, _DDMapOperation):
-                # If current item is a list and expansion level > 1, need to recursively apply mapping
-                if isinstance(item, list) and self.expansion_level > 1:
-                    inner_results: List[Any] = []
-                    for j, inner_item in enumerate(item):
-                        inner_path = item_path + [f"[{j}]"]
-                        operation_copy = self.operation.operation  # Get inner operation
-                        # Create a new mapping operation with expansion level reduced by 1
-                        new_op = _DDMapOperation(operation_copy, self.expansion_level - 1)
-                        inner_results.append(new_op.apply(inner_item, inner_path))
-                    result.append(inner_results)
-                else:
-                    result.append(self.operation.apply(item, item_path))
-            else:
-                result.append(self.operation.apply(item, item_path))
+        for i, item in enumerate(items):
+            try:
+                result.append(op_apply(item) if depth == 1 else self._map(item, depth - 1))
+            except DDException as e:
+                e.path.insert(0, f"[{i}]")
+                raise
 
         return result
 
 
+class _DDFilterOperation(_DDOperation):
+    """Filtering operation of dd_where(), keeps the elements of an expanded list the predicate accepts"""
+
+    __slots__ = ("predicate",)
+
+    opcode = _OP_FILTER
+    token = "where(...)"
+
+    def __init__(self, predicate: Callable[[Any], Any]):
+        self.predicate: Callable[[Any], Any] = predicate
+
+    def signature(self) -> Tuple[Any, ...]:
+        # The predicate is bound when the chain is compiled, every new lambda reuses the generated code
+        return (_OP_FILTER,)
+
+    def apply(self, value: Any) -> List[Any]:
+        if value is None:
+            return []
+        # Same shape rules as _DDMapOperation: a non-list value is a single element
+        if type(value) is not list and not isinstance(value, list):
+            value = (value,)
+        predicate = self.predicate
+        try:
+            return [item for item in value if predicate(item)]
+        except Exception as e:
+            raise DDException(f"Predicate error: {str(e)}", [self.token], value) from e
+
+
+class _DDFusedOperation(_DDOperation):
+    """Consecutive operations applied to the same element, so one map covers a whole a.b.c run"""
+
+    __slots__ = ("operations", "applies")
+
+    opcode = _OP_FUSED
+
+    def __init__(self, operations: Tuple[_DDOperation, ...]):
+        self.operations: Tuple[_DDOperation, ...] = operations
+        # Bound once here, applying the run to an element does no attribute lookups
+        self.applies: Tuple[Callable[[Any], Any], ...] = tuple(op.apply for op in operations)
+
+    def signature(self) -> Tuple[Any, ...]:
+        return (_OP_FUSED, tuple(op.signature() for op in self.operations))
+
+    def apply(self, value: Any) -> Any:
+        # Only applied under a map, which replays the steps unfused to report a failure
+        for apply in self.applies:
+            value = apply(value)
+        return value
+
+
+class _NullSafeStop:
+    """Result of a compiled null-safe chain that stopped at a None, walked operations were applied"""
+
+    __slots__ = ("walked",)
+
+    def __init__(self, walked: int):
+        self.walked: int = walked
+
+
+def _tokens(operations: Sequence[_DDOperation]) -> List[str]:
+    """Error path entries for operations that were applied in full"""
+    return [op.token for op in operations if op.token is not None]
+
+
+def _bindings(
+    operations: Sequence[_DDOperation],
+) -> Tuple[Tuple[Callable[[Any], Any], ...], Tuple[Any, ...]]:
+    """dd_where() predicates and lookup keys of operations, in the order the generated code numbers them"""
+    predicates: List[Callable[[Any], Any]] = []
+    keys: List[Any] = []
+    pending = list(reversed(operations))
+    while pending:
+        op = pending.pop()
+        tag = op.opcode
+        if tag == _OP_ATTR or tag == _OP_ITEM:
+            keys.append(op.key)
+        elif tag == _OP_FILTER:
+            predicates.append(op.predicate)
+        elif tag == _OP_MAP:
+            pending.append(op.operation)
+        elif tag == _OP_FUSED:
+            pending.extend(reversed(op.operations))
+    return tuple(predicates), tuple(keys)
+
+
+def _expand_elements(value: Any) -> Iterable:
+    """[...] for compiled chains, refuses anything it could not replay through the interpreter"""
+    if value is None:
+        return ()
+    t = type(value)
+    if t is dict:
+        return value.values()
+    if t in _REITERABLE_TYPES:
+        return value
+    raise TypeError(f"Cannot expand {t.__name__} in a compiled chain")
+
+
+def _expand_reiterable(value: Any) -> List[Any]:
+    return list(_expand_elements(value))
+
+
+def _lookup_or_none(value: Any, key: Any) -> Any:
+    """Null-safe subscript for compiled chains, misses give None and other errors propagate"""
+    try:
+        return value[key]
+    except (KeyError, IndexError):
+        return None
+
+
+def _map_below(signature: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Signature applied to each element of a map, the same map one level shallower or its operation"""
+    _, levels, inner_signature = signature
+    return inner_signature if levels == 1 else (_OP_MAP, levels - 1, inner_signature)
+
+
+def _list_expr(var: str) -> str:
+    """Source expression for the elements a map or a filter walks, a non-list value is a single element"""
+    return f"({var} if type({var}) is list or isinstance({var}, list) else ({var},))"
+
+
+def _key_expr(constants: Dict[str, Any]) -> str:
+    """Source name for the next lookup key, a parameter of the _dd_bind the chain is bound with"""
+    index = constants["_keys"]
+    constants["_keys"] = index + 1
+    return f"_k{index}"
+
+
+def _predicate_expr(constants: Dict[str, Any]) -> str:
+    """Source expression for the next dd_where() predicate, taken from the _p the chain is bound to"""
+    index = constants["_filters"]
+    constants["_filters"] = index + 1
+    return f"_p[{index}]"
+
+
+def _codegen_expr(
+    signature: Tuple[Any, ...], var: str, constants: Dict[str, Any], helpers: List[str], depth: int
+) -> Optional[str]:
+    """Source expression applying one operation to the name var, None if unsupported
+
+    Operations that need statements are emitted as helper functions into helpers.
+    """
+    tag = signature[0]
+    if tag == _OP_ATTR or tag == _OP_ITEM:
+        name = _key_expr(constants)
+        if signature[-1]:
+            # Null-safe misses resolve to None right here, a replay through the interpreter
+            # would only build a DDException to throw it away
+            return (
+                f"(None if {var} is None else _dict_get({var}, {name}) if type({var}) is dict"
+                f" else _lookup_or_none({var}, {name}))"
+            )
+        return f"{var}[{name}]"
+    if tag == _OP_MAP:
+        item = f"_x{depth}"
+        each = _codegen_expr(_map_below(signature), item, constants, helpers, depth + 1)
+        if each is None:
+            return None
+        # Same shape rules as _DDMapOperation: None maps to [], a non-list value to a single element
+        return f"([] if {var} is None else [{each} for {item} in {_list_expr(var)}])"
+    if tag == _OP_FILTER:
+        item = f"_x{depth}"
+        predicate = _predicate_expr(constants)
+        return f"([] if {var} is None else [{item} for {item} in {_list_expr(var)} if {predicate}({item})])"
+    if tag == _OP_FUSED:
+        inner_signatures = signature[1]
+        if all(sig[0] in (_OP_ATTR, _OP_ITEM) and not sig[-1] for sig in inner_signatures):
+            # Strict lookups compose into a single subscript chain
+            expr = var
+            for sig in inner_signatures:
+                expr = _codegen_expr(sig, expr, constants, helpers, depth)
+            return expr
+        body = _codegen_body(inner_signatures, False, constants, helpers, depth)
+        if body is None:
+            return None
+        name = f"_f{len(helpers)}"
+        helpers.append("\n".join([f"def {name}(v):"] + body + ["    return v"]))
+        return f"{name}({var})"
+    return None
+
+
+def _codegen_body(
+    signatures: Tuple[Tuple[Any, ...], ...],
+    null_safe: bool,
+    constants: Dict[str, Any],
+    helpers: List[str],
+    depth: int,
+    starts: Sequence[int] = (),
+) -> Optional[List[str]]:
+    """Statements applying signatures in order to the local v, None if some operation is unsupported
+
+    A null-safe body stops at a None with a _NullSafeStop, starts holds the number of operations
+    applied before each signature.
+    """
+    lines: List[str] = []
+    i = 0
+    while i < len(signatures):
+        op_signature = signatures[i]
+        if null_safe:
+            stop = f"_s{starts[i]}"
+            constants[stop] = _NullSafeStop(starts[i])
+            lines.append("    if v is None:")
+            lines.append(f"        return {stop}")
+        i += 1
+        tag = op_signature[0]
+        if tag == _OP_EXPAND or tag == _OP_FILTER:
+            # [...] or dd_where() feeding further filters and a map becomes one comprehension over
+            # the elements, no expanded or filtered list is built in between
+            item = f"_x{depth}"
+            conditions = [f" if {_predicate_expr(constants)}({item})"] if tag == _OP_FILTER else []
+            while i < len(signatures) and signatures[i][0] == _OP_FILTER:
+                conditions.append(f" if {_predicate_expr(constants)}({item})")
+                i += 1
+            following = signatures[i] if i < len(signatures) and signatures[i][0] == _OP_MAP else None
+            if tag == _OP_EXPAND and not conditions and following is None:
+                lines.append("    v = _expand(v)")
+                continue
+            each = item
+            if following is not None:
+                each = _codegen_expr(_map_below(following), item, constants, helpers, depth + 1)
+                if each is None:
+                    return None
+                i += 1
+            filtered = "".join(conditions)
+            if tag == _OP_EXPAND:
+                lines.append(f"    v = [{each} for {item} in _elements(v){filtered}]")
+            else:
+                lines.append(f"    v = [] if v is None else [{each} for {item} in {_list_expr('v')}{filtered}]")
+            continue
+        expr = _codegen_expr(op_signature, "v", constants, helpers, depth)
+        if expr is None:
+            return None
+        lines.append(f"    v = {expr}")
+    return lines
+
+
+def _map_depth(signature: Tuple[Any, ...]) -> int:
+    """Levels a map signature walks, including maps nested into its innermost run"""
+    _, levels, inner = signature
+    last = inner[1][-1] if inner[0] == _OP_FUSED else inner
+    return levels + (_map_depth(last) if last[0] == _OP_MAP else 0)
+
+
+def _nest_map(signature: Tuple[Any, ...], inner_signature: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """The map signature with inner_signature mapped over each of its innermost results"""
+    _, levels, inner = signature
+    run = inner[1] if inner[0] == _OP_FUSED else (inner,)
+    if run[-1][0] == _OP_MAP:
+        # Runs never end in a map on their own, this one was nested here before
+        run = run[:-1] + (_nest_map(run[-1], inner_signature),)
+    else:
+        run = run + ((_OP_MAP, 1, inner_signature),)
+    return (_OP_MAP, levels, (_OP_FUSED, run))
+
+
+def _fuse_expansions(
+    signatures: Tuple[Tuple[Any, ...], ...]
+) -> Tuple[Tuple[Tuple[Any, ...], ...], Tuple[int, ...]]:
+    """Fold a map, [...] and a map one level deeper into a single walk
+
+    The [...] between them only copies the list the first map built, and the deeper map
+    passes the outer levels through unchanged, so a.b[...].c[...].d visits every element
+    once instead of building and rewalking a nested list per level.
+    Also returns the index in signatures each of the folded signatures starts at.
+    """
+    fused: List[Tuple[Any, ...]] = []
+    starts: List[int] = []
+    for index, op_signature in enumerate(signatures):
+        if (
+            op_signature[0] == _OP_MAP
+            and len(fused) >= 2
+            and fused[-1][0] == _OP_EXPAND
+            and fused[-2][0] == _OP_MAP
+            and _map_depth(fused[-2]) == op_signature[1] - 1
+        ):
+            fused[-2:] = [_nest_map(fused[-2], op_signature[2])]
+            del starts[-1]
+        else:
+            fused.append(op_signature)
+            starts.append(index)
+    return tuple(fused), tuple(starts)
+
+
+@lru_cache(maxsize=4096)
+def _compile_chain(
+    signature: Tuple[Tuple[Any, ...], ...], null_safe: bool
+) -> Optional[Callable[..., Callable[[Any], Any]]]:
+    """Compile an operation chain into a single generated accessor function
+
+    The accessor only covers the successful path. When it raises, the caller replays the
+    chain through _interpret, which owns null-safe misses and error reporting.
+    Keys and dd_where() predicates are not part of the generated code, so one accessor serves
+    every chain of the same shape. Returns a function binding the accessor to a chain's
+    predicates and keys, or None when some operation has no compiled form.
+    """
+    constants: Dict[str, Any] = {
+        "_expand": _expand_reiterable,
+        "_elements": _expand_elements,
+        "_dict_get": _dict_get,
+        "_lookup_or_none": _lookup_or_none,
+        "_filters": 0,
+        "_keys": 0,
+    }
+    helpers: List[str] = []
+    fused, starts = _fuse_expansions(signature)
+    body = _codegen_body(fused, null_safe, constants, helpers, 0, starts)
+    if body is None:
+        return None
+    source = "\n\n".join(helpers + ["\n".join(["def _dd_chain(v):"] + body + ["    return v"])])
+    # Keys are closure variables, loaded as fast as constants
+    parameters = ", ".join(["_p"] + [f"_k{index}" for index in range(constants["_keys"])])
+    source = "\n".join([f"def _dd_bind({parameters}):", textwrap.indent(source, "    "), "    return _dd_chain"])
+
+    # Builtins used by the generated code resolve from the function's globals, not the builtins fallback
+    namespace: Dict[str, Any] = {"isinstance": isinstance, "list": list, "type": type}
+    namespace.update(constants)
+    exec(compile(source, "<dd>", "exec"), namespace)
+    return namespace["_dd_bind"]
+
+
+# Operations are immutable, so a chain shape used for every row of a dataset
+# reuses the same operation objects instead of building new ones per row
+_attribute_operation = lru_cache(maxsize=4096)(_DDAttributeOperation)
+# Typed, 1 and True hash equal but are different keys
+_item_operation = lru_cache(maxsize=4096, typed=True)(_DDItemOperation)
+_EXPAND_OPERATION = _DDExpandOperation()
+# Keyed by the identity of the shared operations they wrap
+_map_operation = lru_cache(maxsize=4096)(_DDMapOperation)
+_fused_operation = lru_cache(maxsize=4096)(_DDFusedOperation)
+
+
+def _apply_flat(value: Any, operations: List[_DDOperation], null_safe: bool) -> Any:
+    """Apply a chain of plain lookups
+
+    A null-safe chain that meets a None, or a null-safe lookup that misses, stops with a
+    _NullSafeStop like a compiled chain. _MISSING if some lookup fails and the interpreter
+    has to take over.
+    """
+    if not null_safe:
+        try:
+            for op in operations:
+                value = value[op.key]
+        except Exception:
+            return _MISSING
+        return value
+
+    try:
+        for i, op in enumerate(operations):
+            if value is None:
+                return _NullSafeStop(i)
+            if op.null_safe and type(value) is dict:
+                # A miss is None without raising, the next step stops on it
+                value = _dict_get(value, op.key)
+            else:
+                value = value[op.key]
+    except (KeyError, IndexError):
+        return _NullSafeStop(i + 1) if op.null_safe else _MISSING
+    except Exception:
+        return _MISSING
+    return value
+
+
+def _compiled(operations: Sequence[_DDOperation], null_safe: bool) -> Optional[Callable[[Any], Any]]:
+    bind = _compile_chain(tuple(op.signature() for op in operations), null_safe)
+    if bind is None:
+        return None
+    predicates, keys = _bindings(operations)
+    return bind(predicates, *keys)
+
+
+@lru_cache(maxsize=4096)
+def _shared_chain_runner(operations: Tuple[_DDOperation, ...], null_safe: bool) -> Optional[Callable[[Any], Any]]:
+    """Compiled accessor for a chain of shared operations
+
+    Identical chains are built from the same operation objects, so they are found here by
+    identity without building their signatures again.
+    """
+    return _compiled(operations, null_safe)
+
+
+def _chain_runner(
+    operations: Tuple[_DDOperation, ...], null_safe: bool, filtered: bool
+) -> Optional[Callable[[Any], Any]]:
+    """Compiled accessor for a chain of operations, filtered if some of them come from dd_where()"""
+    if filtered:
+        # The operations hold the caller's predicates, a shared cache would keep them alive
+        return _compiled(operations, null_safe)
+    return _shared_chain_runner(operations, null_safe)
+
+
 class dd:
     """Main data access class, initializes a data navigation operation"""
 
+    # Slots only remove the instance __dict__, __getattr__ still handles every other name
+    __slots__ = ("_value", "_null_safe", "__parent", "__op", "__cached_ops", "__depth", "__filtered", "__runner")
+
     def __init__(
         self,
         value: Any,
@@ -140,70 +701,236 @@ class dd:
         expansion_levels: Optional[List[int]] = None,
     ):
         self._value: Any = value
-        self._operations: List[_DDOperation] = operations or []
+        # Chain steps only link to their parent and add one operation, the full list is
+        # materialized on demand, so building an n-step chain costs O(n) instead of O(n^2)
+        self.__parent: Optional[dd] = None
+        self.__op: Optional[_DDOperation] = None
+        self.__cached_ops: Optional[List[_DDOperation]] = list(operations) if operations else []
         self._null_safe: bool = null_safe
-        self._expansion_levels: List[int] = expansion_levels or []  # Record each expansion level
+        # Number of open expansion levels, every level is 1 so the count is all the list carried
+        self.__depth: int = len(expansion_levels) if expansion_levels else 0
+        # Whether some operation is a dd_where() filter
+        self.__filtered: bool = bool(operations and _bindings(operations)[0])
+        # Compiled accessor for this chain, looked up on the first call
+        self.__runner: Any = _MISSING
+
+    @property
+    def _operations(self) -> List[_DDOperation]:
+        """The operations of the whole chain, collected from the parents once and cached"""
+        operations = self.__cached_ops
+        if operations is None:
+            tail: List[_DDOperation] = []
+            append = tail.append
+            node = self
+            root = None
+            while root is None:
+                append(node.__op)
+                node = node.__parent
+                root = node.__cached_ops
+            tail.reverse()
+            # A chain from dd(value) starts without operations, its own steps are the whole list
+            operations = root + tail if root else tail
+            self.__cached_ops = operations
+        return operations
 
     def __getattr__(self, attr: str) -> "dd":
         if attr == "_":
             # Return a new dd instance with the same value and operations, but with null_safe enabled
-            return dd(self._value, self._operations, True, self._expansion_levels)
-
-        # Create a new attribute operation
-        attr_op = _DDAttributeOperation(attr, self._null_safe)
-
-        # If expansion levels exist, need to wrap the operation with _DDMapOperation
-        if self._expansion_levels:
-            # Create nested mapping operations for each expansion level
-            op: _DDOperation = attr_op
-            for level in reversed(self._expansion_levels):
-                op = _DDMapOperation(op, level)
-            return dd(self._value, self._operations + [op], self._null_safe, self._expansion_levels)
-        else:
-            return dd(self._value, self._operations + [attr_op], self._null_safe, [])
+            safe = dd.__new__(dd)
+            safe._value = self._value
+            safe.__parent = self.__parent
+            safe.__op = self.__op
+            safe.__cached_ops = self.__cached_ops
+            safe._null_safe = True
+            safe.__depth = self.__depth
+            safe.__filtered = self.__filtered
+            safe.__runner = _MISSING
+            return safe
+
+        return _then(self, _attribute_operation(attr, self._null_safe))
 
     def __getitem__(self, key: Any) -> "dd":
         if key is Ellipsis:  # Handle [...]
-            # Add a new expansion level
-            new_levels = self._expansion_levels + [1]
-            # Return a new dd instance, add expansion operation, and record expansion level
-            return dd(self._value, self._operations + [_DDExpandOperation()], self._null_safe, new_levels)
-
-        # Create a new item operation
-        item_op = _DDItemOperation(key, self._null_safe)
-
-        # If expansion levels exist, need to wrap the operation with _DDMapOperation
-        if self._expansion_levels:
-            # Create nested mapping operations for each expansion level
-            op: _DDOperation = item_op
-            for level in reversed(self._expansion_levels):
-                op = _DDMapOperation(op, level)
-            return dd(self._value, self._operations + [op], self._null_safe, self._expansion_levels)
+            # Return a new dd instance with the expansion operation, one expansion level deeper
+            return _link(self, _EXPAND_OPERATION, self._null_safe, self.__depth + 1)
+
+        if type(key) in _SHARED_KEY_TYPES:
+            op = _item_operation(key, self._null_safe)
         else:
-            return dd(self._value, self._operations + [item_op], self._null_safe, [])
+            # Tuples, floats, unhashable keys (e.g. slices) and the like are not shared
+            op = _DDItemOperation(key, self._null_safe)
+        return _then(self, op)
 
     def __call__(self, convert: Optional[Callable[[Any], _R]] = None) -> _R:
         """Execute all operations and get the final result"""
-        result: Any = self._value
-        path: List[str] = ["dd"]
-
-        for op in self._operations:
-            if result is None and self._null_safe:
-                result = None
-                break
-
+        if self.__op is None and not self.__cached_ops:
+            # Nothing to navigate (dd(v)()), decided from the slots without materializing the
+            # operations, the value is returned as is or handed straight to the converter
+            if convert is None:
+                return self._value
             try:
-                result = op.apply(result, path)
+                return convert(self._value)
             except Exception as e:
-                if isinstance(e, DDException):
-                    raise
-                raise DDException(f"Unexpected error: {str(e)}", path, result) from e
+                raise DDException(f"Conversion error: {str(e)}", ["dd"], self._value) from e
+
+        run = self.__runner
+        # Operations applied to reach result, None for all of them. Kept while walking,
+        # a converter error must not walk the data again to find its path
+        walked: Optional[int] = None
+        if run is _MISSING and not self.__depth:
+            # Without [...] the chain is only lookups, for a single call walking them directly is
+            # cheaper than building its signature to find a compiled accessor. A dd that turns out
+            # to be called again compiles on its second call
+            self.__runner = _CALLED_ONCE
+            result = _apply_flat(self._value, self._operations, self._null_safe)
+            if result is _MISSING:
+                result, walked = _interpret(self)
+            elif type(result) is _NullSafeStop:
+                walked = result.walked
+                result = None
+        else:
+            if run is _MISSING or run is _CALLED_ONCE:
+                # A dd called repeatedly skips the signature build and the cache lookup
+                run = self.__runner = _chain_runner(tuple(self._operations), self._null_safe, self.__filtered)
+            if run is None:
+                result, walked = _interpret(self)
+            else:
+                try:
+                    result = run(self._value)
+                except Exception:
+                    # Replay through the interpreter, it knows how to recover null-safe misses
+                    # and which path to report when the chain really fails
+                    result, walked = _interpret(self)
+                else:
+                    if type(result) is _NullSafeStop:
+                        walked = result.walked
+                        result = None
 
         # Should reach here even if convert is None, to keep all operations applied
         if convert is not None:
             try:
                 return convert(result)
             except Exception as e:
+                path = ["dd"] + _tokens(self._operations[:walked])
                 raise DDException(f"Conversion error: {str(e)}", path, result) from e
 
         return result
+
+
+# The chain helpers below are functions and the chain state is name-mangled, so that none
+# of it takes a name a data key could use: dd({"_parent": {"x": 1}})._parent.x() is 1
+def _link(parent: dd, op: _DDOperation, null_safe: bool, depth: int) -> dd:
+    """Create the dd for parent's chain followed by op"""
+    child = dd.__new__(dd)
+    child._value = parent._value
+    child._dd__parent = parent
+    child._dd__op = op
+    child._dd__cached_ops = None
+    child._null_safe = null_safe
+    child._dd__depth = depth
+    child._dd__filtered = parent._dd__filtered
+    child._dd__runner = _MISSING
+    return child
+
+
+def _then(chain: dd, op: _DDOperation) -> dd:
+    """Return a new dd with op appended, mapped over every open expansion level"""
+    if not chain._dd__depth:
+        return _link(chain, op, chain._null_safe, 0)
+
+    parent = chain
+    last = chain._dd__op
+    if isinstance(last, _DDMapOperation) and last.depth == chain._dd__depth:
+        # The previous step already maps at this depth, extend its inner run instead of
+        # adding another map, so each element is walked once for the whole a.b.c
+        inner = last.operation
+        fused = inner.operations + (op,) if isinstance(inner, _DDFusedOperation) else (inner, op)
+        op = _fused_operation(fused)
+        parent = chain._dd__parent
+
+    return _link(parent, _map_operation(op, chain._dd__depth), chain._null_safe, chain._dd__depth)
+
+
+def _interpret(chain: dd) -> Tuple[Any, int]:
+    """Apply the operations one by one, returns the result and how many operations were applied
+
+    No path is tracked while walking, a failing step reports its own entries and
+    the walked prefix is prepended here from the operations' tokens.
+    """
+    result: Any = chain._value
+    operations = chain._operations
+    # Constant for the whole run, strict chains only pay a local flag test per step
+    null_safe = chain._null_safe
+    # Locals instead of module globals inside the loop
+    attr_tag, item_tag, expand_tag, map_tag = _OP_ATTR, _OP_ITEM, _OP_EXPAND, _OP_MAP
+    n = len(operations)
+    i = 0
+    while i < n:
+        if null_safe and result is None:
+            break
+        op = operations[i]
+
+        try:
+            tag = op.opcode
+            if tag == attr_tag or tag == item_tag:
+                # Plain lookups are inlined, only a failed lookup goes through apply()
+                # so that null-safety and error reporting stay in one place
+                try:
+                    result = result[op.key]
+                except Exception:
+                    result = op.apply(result)
+            elif tag == expand_tag and i + 1 < n and operations[i + 1].opcode == map_tag:
+                # Stream the expanded elements straight into the following map
+                result = op.apply_mapped(result, operations[i + 1])
+                i += 1
+            else:
+                result = op.apply(result)
+        except DDException as e:
+            e.path[:0] = ["dd"] + _tokens(operations[:i])
+            raise
+        except Exception as e:
+            raise DDException(f"Unexpected error: {str(e)}", ["dd"] + _tokens(operations[:i]), result) from e
+        i += 1
+
+    return result, i
+
+
+def dd_where(chain: dd, predicate: Callable[[Any], Any]) -> dd:
+    """Keep only the elements of the chain's innermost [...] that predicate accepts
+
+    The filter and the operations after it walk the elements once:
+    dd_where(dd(data).users[...], lambda user: user["age"] >= 18).name().
+    A function, as a dd method it would shadow data keys of the same name.
+    """
+    if not chain._dd__depth:
+        raise DDException("dd_where() needs a [...] to filter", ["dd"] + _tokens(chain._operations), chain._value)
+    op: _DDOperation = _DDFilterOperation(predicate)
+    if chain._dd__depth > 1:
+        # The lists the innermost [...] expanded sit one level above its elements
+        op = _DDMapOperation(op, chain._dd__depth - 1)
+    filtered = _link(chain, op, chain._null_safe, chain._dd__depth)
+    filtered._dd__filtered = True
+    return filtered
+
+
+def dd_map(chain: dd, roots: Iterable) -> Iterator[Any]:
+    """Apply chain to every root in roots, lazily yielding the results
+
+    The chain is compiled once instead of being built and looked up again for every root,
+    the value it was created with is ignored: dd_map(dd(None).user.name, rows).
+    A function, as a dd method it would shadow data keys of the same name.
+    """
+    operations = chain._operations
+    null_safe = chain._null_safe
+    run = _chain_runner(tuple(operations), null_safe, chain._dd__filtered)
+    for root in roots:
+        if run is not None:
+            try:
+                result = run(root)
+            except Exception:
+                result = _MISSING
+            if result is not _MISSING:
+                yield None if type(result) is _NullSafeStop else result
+                continue
+        # Same as calling dd(root) with this chain, including null-safe recovery and error paths
+        yield _interpret(dd(root, operations, null_safe))[0]
@@ -1,9 +1,118 @@
-from functools import partial
+import copy
+import gc
+import os
+from functools import lru_cache, reduce
+from itertools import chain
+from operator import itemgetter
 import unittest
-from dd import dd, DDException
+import weakref
+from dd import dd, dd_map, dd_where, DDException
+from dd.dd import _compile_chain
+
+# Set DD_BENCH=1 to print the timings measured by the performance test
+_BENCH = os.environ.get("DD_BENCH") == "1"
+
+# Ranges reused by the performance fixture builder
+_R100 = range(100)
+_R20 = range(20)
+
+# Read-only values and tags shared by every record of the performance fixture
+_SHARED_VALUES = tuple(_R100)
+_TAGS = [f"tag{k}" for k in _R20]
+
+
+def _usernames_or_texts(data_values):
+    """Converter picking each data's username, else its text, else None"""
+    return [(d.get("username") if d and "username" in d else (d.get("text") if d else None)) for d in data_values]
 
 
 class TestDataDot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Build the larger read-only fixtures once for the whole class"""
+        # Nested structure with depth of 20 for test_large_nested_data, built from the deepest level up
+        cls._LARGE_NESTED = reduce(
+            lambda inner, level: {"level": level, "next": inner}, range(19, -1, -1), {"level": 20}
+        )
+
+        # Departments for test_nested_expansion
+        cls._DEPARTMENTS = {
+            "departments": [
+                {
+                    "name": "Engineering",
+                    "teams": [
+                        {"name": "Frontend", "members": [{"name": "Alice"}, {"name": "Bob"}]},
+                        {"name": "Backend", "members": [{"name": "Charlie"}, {"name": "Dave"}]},
+                    ],
+                },
+                {
+                    "name": "Marketing",
+                    "teams": [
+                        {"name": "Digital", "members": [{"name": "Eve"}, {"name": "Frank"}]},
+                        {"name": "Brand", "members": [{"name": "Grace"}]},
+                    ],
+                },
+            ]
+        }
+
+        # Scenarios of test_map_operations_on_expanded_elements
+        cls._USERS_PROFILES = {
+            "users": [
+                {"name": "Alice", "profile": {"age": 30, "city": "New York"}},
+                {"name": "Bob", "profile": {"age": 25, "city": "Chicago"}},
+                {"name": "Charlie", "profile": {"age": 35, "city": "San Francisco"}},
+            ]
+        }
+        cls._DEPT_EMPLOYEES = {
+            "departments": [
+                {"name": "Engineering", "employees": [{"id": 1, "role": "Developer"}, {"id": 2, "role": "Designer"}]},
+                {"name": "Marketing", "employees": [{"id": 3, "role": "Manager"}, {"id": 4, "role": "Copywriter"}]},
+            ]
+        }
+        cls._ITEMS = {
+            "items": [
+                {"type": "user", "data": {"username": "alice"}},
+                {"type": "post"},
+                {"type": "comment", "data": {"text": "Great post!"}},
+            ]
+        }
+
+        # Deeply nested structure for test_highly_nested_expansions
+        cls._NESTED_LEVELS = {
+            "level1": [
+                {
+                    "name": "A",
+                    "level2": [
+                        {"name": "A1", "level3": [{"name": "A1a", "value": 1}, {"name": "A1b", "value": 2}]},
+                        {"name": "A2", "level3": [{"name": "A2a", "value": 3}, {"name": "A2b", "value": 4}]},
+                    ],
+                },
+                {
+                    "name": "B",
+                    "level2": [
+                        {"name": "B1", "level3": [{"name": "B1a", "value": 5}, {"name": "B1b", "value": 6}]},
+                        {"name": "B2", "level3": None},  # Deliberately place a None
+                    ],
+                },
+            ]
+        }
+
+        # Large records for test_performance_with_complex_operations
+        cls._PERF_RECORDS = {
+            "records": [
+                {
+                    "id": i,
+                    "values": _SHARED_VALUES,
+                    "metadata": {
+                        "tags": _TAGS,
+                        "created": "2023-01-01",
+                        "updated": "2023-01-02",
+                    },
+                }
+                for i in _R100
+            ]
+        }
+
     def test_basic_access(self):
         data = {"users": [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]}
         self.assertEqual(dd(data).users[0].name(), "Alice")
@@ -50,6 +159,164 @@ class TestDataDot(unittest.TestCase):
         self.assertIn("Failed to get attribute 'email'", str(context.exception))
         self.assertIn("dd.users.[0].email", str(context.exception))
 
+    def test_expansion_error_path(self):
+        """Errors raised inside an expansion report the failing element's path"""
+        data = {"users": [{"name": "Alice"}, {"age": 25}]}
+        with self.assertRaises(DDException) as context:
+            dd(data).users[...].name()
+
+        self.assertEqual(context.exception.path, ["dd", "users", "[...]", "[1]", "name"])
+
+        # With several failing elements, the first step is mapped over all of them before the next
+        data = {"users": [{"profile": {}}, {"name": "Bob"}]}
+        with self.assertRaises(DDException) as context:
+            dd(data).users[...].profile.email()
+        self.assertEqual(context.exception.path, ["dd", "users", "[...]", "[1]", "profile"])
+
+    def test_conversion_error_path(self):
+        """A failing converter reports the path walked to its input without walking the data again"""
+
+        class Counting(dict):
+            lookups = 0
+
+            def __getitem__(self, key):
+                Counting.lookups += 1
+                return dict.__getitem__(self, key)
+
+        def clear_and_fail(value):
+            data.clear()
+            raise ValueError("rejected")
+
+        data = Counting(a=Counting(b=1))
+        with self.assertRaises(DDException) as context:
+            dd(data).a.b(clear_and_fail)
+        self.assertIn("Conversion error: rejected", str(context.exception))
+        self.assertEqual(context.exception.path, ["dd", "a", "b"])
+        self.assertEqual(Counting.lookups, 2)
+
+        # A null-safe chain that stopped at a None reports the steps it took, compiled or not
+        chain = dd({"a": None})._.a.b.c
+        for _ in range(2):
+            with self.assertRaises(DDException) as context:
+                chain(clear_and_fail)
+            self.assertEqual(context.exception.path, ["dd", "a"])
+
+        # A null-safe chain that misses settles on the first walk
+        Counting.lookups = 0
+        data = Counting(a=Counting(b=None))
+        self.assertIsNone(dd(data)._.a.c.d())
+        self.assertIsNone(dd(data)._.a.b.d())
+        self.assertEqual(Counting.lookups, 4)
+
+    def test_repeated_chain_shapes(self):
+        """Chains with the same shape give independent results for different roots"""
+        rows = [{"user": {"name": "Alice"}}, {"user": {"name": "Bob"}}, {"user": None}]
+        self.assertEqual([dd(row)._.user.name() for row in rows], ["Alice", "Bob", None])
+        with self.assertRaises(DDException):
+            dd(rows[2]).user.name()
+
+        # One-shot iterators are only consumed once, even when the chain fails
+        records = iter([{"a": 1}, {"b": 2}])
+        with self.assertRaises(DDException) as context:
+            dd({"records": records}).records[...].a()
+        self.assertIn("dd.records.[...].[1].a", str(context.exception))
+
+    def test_equal_keys_of_different_types(self):
+        """Keys that compare equal but differ in type reach __getitem__ exactly as given"""
+
+        class Recorder:
+            def __init__(self):
+                self.keys = []
+
+            def __getitem__(self, key):
+                self.keys.append(key)
+                return key
+
+        recorder = Recorder()
+        chains = [dd(recorder)[key] for key in [(1, 1), (True, 1), (1.0, 1), 0.0, -0.0]]
+        for chain in chains:
+            chain()
+            chain()  # Compiled on the second call
+        self.assertEqual(
+            [repr(key) for key in recorder.keys],
+            ["(1, 1)", "(1, 1)", "(True, 1)", "(True, 1)", "(1.0, 1)", "(1.0, 1)", "0.0", "0.0", "-0.0", "-0.0"],
+        )
+
+    def test_distinct_keys_share_compiled_code(self):
+        """Chains that only differ in their keys are served by one generated accessor"""
+        _compile_chain.cache_clear()
+        data = {"rows": [{"k0": 0, "k1": 1, "k2": 2}, {"k0": 3, "k1": 4, "k2": 5}]}
+        for i in range(3):
+            column = dd(data).rows[...][f"k{i}"]
+            self.assertEqual(column(), [i, i + 3])
+            self.assertEqual(column(), [i, i + 3])
+        self.assertEqual(_compile_chain.cache_info().currsize, 1)
+
+    def test_chain_objects_have_no_instance_dict(self):
+        """Chain objects and their operations are slotted, a chain step allocates no __dict__"""
+        chain = dd_where(dd({"users": [{"name": "Alice"}]})._.users[...], bool).name
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(chain, "__dict__")
+        for op in chain._operations:
+            self.assertFalse(hasattr(op, "__dict__"), type(op).__name__)
+
+    def test_underscore_keys(self):
+        """Keys named like the chain's internals still navigate the data"""
+        for key in ["_parent", "_op", "_cached_ops", "_depth", "_filtered", "_runner", "_then", "_link", "_interpret"]:
+            data = {key: {"x": 1}}
+            self.assertEqual(getattr(dd(data), key).x(), 1, key)
+            self.assertEqual(getattr(dd(data)._, key).x(), 1, key)
+            self.assertEqual(getattr(dd({"rows": [data]}).rows[...], key).x(), [1], key)
+
+    def test_dd_map(self):
+        """One chain applied to many roots gives the same results as building it per root"""
+        rows = [{"user": {"name": "Alice"}}, {"user": None}, {"user": {"name": "Bob"}}]
+        self.assertEqual(list(dd_map(dd(None)._.user.name, rows)), ["Alice", None, "Bob"])
+        self.assertEqual(list(dd_map(dd(None).user[...], [{"user": {"a": 1, "b": 2}}])), [[1, 2]])
+
+        with self.assertRaises(DDException) as context:
+            list(dd_map(dd(None).user.name, rows))
+        self.assertIn("dd.user.name", str(context.exception))
+
+    def test_dd_where(self):
+        """dd_where() filters the elements of the innermost expansion, the following steps only see the kept ones"""
+        data = {"groups": [{"users": None}, {"users": [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 15}]}]}
+        adults = dd_where(dd(data).groups[...]._.users[...], lambda user: user["age"] >= 18).name
+        self.assertEqual(adults(), [[], ["Alice"]])
+        self.assertEqual(adults(), [[], ["Alice"]])  # Compiled on the second call
+
+        numbers = dd({"numbers": [1, 2, 3, 4, 5]}).numbers[...]
+        self.assertEqual(dd_where(dd_where(numbers, lambda n: n % 2), lambda n: n > 1)(), [3, 5])
+        # A new predicate per chain is bound to the same generated code
+        self.assertEqual(
+            [dd_where(numbers, lambda n, limit=limit: n > limit)() for limit in range(3)],
+            [[1, 2, 3, 4, 5], [2, 3, 4, 5], [3, 4, 5]],
+        )
+        self.assertEqual(list(dd_map(dd_where(dd(None).numbers[...], lambda n: n > 1), [{"numbers": [1, 2]}])), [[2]])
+
+        with self.assertRaises(DDException) as context:
+            dd_where(dd({"items": [1, "a"]}).items[...], lambda n: n > 0)()
+        self.assertIn("dd.items.[...].where(...)", str(context.exception))
+        with self.assertRaises(DDException):
+            dd_where(dd(data).groups, bool)
+
+        # No cache keeps a predicate alive once its chain is gone, under one expansion or several
+        for expanded in (dd(data).groups[...], dd(data).groups[...]._.users[...]):
+
+            def predicate(value):
+                return True
+
+            predicate_ref = weakref.ref(predicate)
+            filtered = dd_where(expanded, predicate)
+            filtered()
+            filtered()
+            del filtered, predicate
+            gc.collect()
+            self.assertIsNone(predicate_ref())
+
+        # A data key with the same name is still an attribute
+        self.assertEqual(dd({"where": 1}).where(), 1)
+
     def test_complex_operations(self):
         data = {"groups": [{"users": None}, {"users": [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 15}]}]}
 
@@ -58,17 +325,20 @@ class TestDataDot(unittest.TestCase):
             dd(data).groups[...]._.users[...].age(), [[], [30, 15]]
         )  # The transitivity of ._ makes subsequent operations null-safe
 
-        # Get only adult names
+        # Get only adult names, dict.get is called unbound so no method is looked up per user
+        get = dict.get
         adults = (
             dd(data)
             .groups[...]
             ._.users[...](
                 lambda users_groups: [
-                    [user["name"] for user in (users or []) if user.get("age", 0) >= 18] for users in users_groups
+                    [user["name"] for user in (users or []) if get(user, "age", 0) >= 18] for users in users_groups
                 ]
             )
         )
         self.assertEqual(adults, [[], ["Alice"]])
+        adult_users = dd_where(dd(data).groups[...]._.users[...], lambda user: get(user, "age", 0) >= 18)
+        self.assertEqual(adult_users.name(), adults)
 
     def test_custom_transformations(self):
         data = {"items": [{"price": 10}, {"price": 20}, {"price": 30}]}
@@ -92,24 +362,7 @@ class TestDataDot(unittest.TestCase):
 
     def test_nested_expansion(self):
         """Test nested [...] operations"""
-        data = {
-            "departments": [
-                {
-                    "name": "Engineering",
-                    "teams": [
-                        {"name": "Frontend", "members": [{"name": "Alice"}, {"name": "Bob"}]},
-                        {"name": "Backend", "members": [{"name": "Charlie"}, {"name": "Dave"}]},
-                    ],
-                },
-                {
-                    "name": "Marketing",
-                    "teams": [
-                        {"name": "Digital", "members": [{"name": "Eve"}, {"name": "Frank"}]},
-                        {"name": "Brand", "members": [{"name": "Grace"}]},
-                    ],
-                },
-            ]
-        }
+        data = self._DEPARTMENTS
 
         # Get the names of all members in all teams in all departments
         all_member_names = dd(data).departments[...].teams[...].members[...].name()
@@ -121,7 +374,7 @@ class TestDataDot(unittest.TestCase):
             .departments[...]
             .teams[...]
             .members[...]
-            .name(lambda names: [name for dept in names for team in dept for name in team])
+            .name(lambda names: list(chain.from_iterable(chain.from_iterable(names))))
         )
         self.assertEqual(flat_names, ["Alice", "Bob", "Charlie", "Dave", "Eve", "Frank", "Grace"])
 
@@ -134,10 +387,9 @@ class TestDataDot(unittest.TestCase):
             }
         }
 
-        # Custom function to maintain key-value pairs
-        settings_with_keys = dd(data).settings[...](
-            lambda values: [{k: v} for k, v in zip(dd(data).settings().keys(), values)]
-        )
+        # Custom function to maintain key-value pairs, the keys are read once outside the converter
+        keys = list(data["settings"].keys())
+        settings_with_keys = dd(data).settings[...](lambda values, _k=keys: [{k: v} for k, v in zip(_k, values)])
         self.assertEqual(
             settings_with_keys,
             [{"display": {"theme": "dark", "font": "Arial"}}, {"privacy": {"cookies": "accept", "tracking": "deny"}}],
@@ -198,9 +450,7 @@ class TestDataDot(unittest.TestCase):
             lambda products: [
                 {
                     "product": {"id": p["id"], "name": p["name"]},
-                    "variants": dd(p).variants[...](
-                        lambda vars: [{"color": v["color"], "price": v["price"]} for v in vars]
-                    ),
+                    "variants": [{"color": v["color"], "price": v["price"]} for v in p["variants"]],
                 }
                 for p in products
             ]
@@ -221,65 +471,43 @@ class TestDataDot(unittest.TestCase):
 
     def test_map_operations_on_expanded_elements(self):
         """Test mapping operations on expanded elements"""
-        # Scenario 1: Simple user list
-        data = {
-            "users": [
-                {"name": "Alice", "profile": {"age": 30, "city": "New York"}},
-                {"name": "Bob", "profile": {"age": 25, "city": "Chicago"}},
-                {"name": "Charlie", "profile": {"age": 35, "city": "San Francisco"}},
-            ]
-        }
+        with self.subTest("simple user list"):
+            data = self._USERS_PROFILES
 
-        # Use [...] to expand the users list, then directly access each user's name
-        names = dd(data).users[...].name()
-        self.assertEqual(names, ["Alice", "Bob", "Charlie"])
+            # Use [...] to expand the users list, then directly access each user's name
+            names = dd(data).users[...].name()
+            self.assertEqual(names, ["Alice", "Bob", "Charlie"])
 
-        # Use [...] to expand the users list, then access each user's profile.city
-        cities = dd(data).users[...].profile.city()
-        self.assertEqual(cities, ["New York", "Chicago", "San Francisco"])
+            # Use [...] to expand the users list, then access each user's profile.city
+            cities = dd(data).users[...].profile.city()
+            self.assertEqual(cities, ["New York", "Chicago", "San Francisco"])
 
-        # Scenario 2: Nested data structure
-        data = {
-            "departments": [
-                {"name": "Engineering", "employees": [{"id": 1, "role": "Developer"}, {"id": 2, "role": "Designer"}]},
-                {"name": "Marketing", "employees": [{"id": 3, "role": "Manager"}, {"id": 4, "role": "Copywriter"}]},
-            ]
-        }
+        with self.subTest("nested data structure"):
+            data = self._DEPT_EMPLOYEES
 
-        # Expand departments, then get each department's name
-        dept_names = dd(data).departments[...].name()
-        self.assertEqual(dept_names, ["Engineering", "Marketing"])
+            # Expand departments, then get each department's name
+            dept_names = dd(data).departments[...].name()
+            self.assertEqual(dept_names, ["Engineering", "Marketing"])
 
-        # Expand departments, then expand each department's employees, and get each employee's role
-        roles = dd(data).departments[...].employees[...].role()
-        self.assertEqual(roles, [["Developer", "Designer"], ["Manager", "Copywriter"]])
+            # Expand departments, then expand each department's employees, and get each employee's role
+            roles = dd(data).departments[...].employees[...].role()
+            self.assertEqual(roles, [["Developer", "Designer"], ["Manager", "Copywriter"]])
 
-        # Scenario 3: Mixed types and null values
-        data = {
-            "items": [
-                {"type": "user", "data": {"username": "alice"}},
-                {"type": "post"},
-                {"type": "comment", "data": {"text": "Great post!"}},
-            ]
-        }
+        with self.subTest("mixed types and null values"):
+            # One expansion of the items, shared by the accesses below
+            items = dd(self._ITEMS).items[...]
 
-        # Use null_safe to handle potentially empty data fields
-        item_types = dd(data).items[...].type()
-        self.assertEqual(item_types, ["user", "post", "comment"])
+            # Use null_safe to handle potentially empty data fields
+            item_types = items.type()
+            self.assertEqual(item_types, ["user", "post", "comment"])
 
-        # Safely access the data field
-        data_values = dd(data).items[...]._.data()
-        self.assertEqual(data_values, [{"username": "alice"}, None, {"text": "Great post!"}])
+            # Safely access the data field
+            data_values = items._.data()
+            self.assertEqual(data_values, [{"username": "alice"}, None, {"text": "Great post!"}])
 
-        # Safely try to get the first available attribute for each data
-        username_or_text = (
-            dd(data)
-            .items[...]
-            ._.data(
-                partial(map, (lambda d: d.get("username") if d and "username" in d else (d.get("text") if d else None)))
-            )
-        )
-        self.assertEqual(list(username_or_text), ["alice", None, "Great post!"])
+            # Safely try to get the first available attribute for each data
+            username_or_text = items._.data(_usernames_or_texts)
+            self.assertEqual(username_or_text, ["alice", None, "Great post!"])
 
     def test_nested_circular_references(self):
         """Test nested circular reference data structures"""
@@ -305,25 +533,17 @@ class TestDataDot(unittest.TestCase):
 
     def test_large_nested_data(self):
         """Test the ability to handle large nested data structures"""
-        # Create a deeply nested large data structure
-        data = {"level": 0}
-        current = data
+        # The tail of this test mutates the structure, work on a copy of the shared fixture
+        data = copy.deepcopy(self._LARGE_NESTED)
 
-        # Create a nested structure with depth of 20
-        for i in range(1, 21):
-            current["next"] = {"level": i}
-            current = current["next"]
+        # Chains are lazy, one root serves every access below
+        root = dd(data)
 
         # Test the ability to correctly access deep data
-        self.assertEqual(dd(data).next.next.next.next.next.level(), 5)
+        self.assertEqual(root.next.next.next.next.next.level(), 5)
 
         # Test a very long access chain
-        self.assertEqual(
-            dd(
-                data
-            ).next.next.next.next.next.next.next.next.next.next.next.next.next.next.next.next.next.next.next.next.level(),
-            20,
-        )
+        self.assertEqual(reduce(getattr, ["next"] * 20, root).level(), 20)
 
         # Test null safety at some point in a long access chain
         current = data
@@ -333,10 +553,10 @@ class TestDataDot(unittest.TestCase):
 
         # Check if normal access would throw an exception
         with self.assertRaises(DDException):
-            dd(data).next.next.next.next.next.next.next.next.next.next.next.level()
+            reduce(getattr, ["next"] * 11, root).level()
 
         # Using ._ should return None
-        self.assertIsNone(dd(data)._.next.next.next.next.next.next.next.next.next.next.next.level())
+        self.assertIsNone(reduce(getattr, ["next"] * 11, root._).level())
 
     def test_heterogeneous_data_expansion(self):
         """Test the ability to expand different types of data"""
@@ -380,8 +600,10 @@ class TestDataDot(unittest.TestCase):
 
         # Ensure expanded values match original values
         dict_keys = list(data["dict_with_different_types"].keys())
-        for i, key in enumerate(dict_keys):
-            self.assertEqual(dd(data).dict_with_different_types[key](), data["dict_with_different_types"][key])
+        expected = list(data["dict_with_different_types"].values())
+        typed = dd(data).dict_with_different_types
+        actual = [typed[key]() for key in dict_keys]
+        self.assertListEqual(actual, expected)
 
     def test_error_recovery_and_path_reporting(self):
         """Test error recovery and path reporting functionality"""
@@ -426,26 +648,28 @@ class TestDataDot(unittest.TestCase):
         }
 
         # Test combining multiple transformation functions
+        stock = itemgetter("stock")
+
         def filter_in_stock(products):
-            return dd([p for p in products if p["stock"] > 0])
+            return dd([p for p in products if stock(p) > 0])
 
         def calculate_value(products):
             return sum(p["price"] * p["stock"] for p in products)
 
-        # Chain-apply transformations
-        in_stock_products = dd(data).products[...](filter_in_stock)()
+        # Chain-apply transformations, a converter may return a dd, which is kept and reused below
+        in_stock = dd(data).products[...](filter_in_stock)
+        self.assertIsInstance(in_stock, dd)
+        in_stock_products = in_stock()
         self.assertEqual(len(in_stock_products), 2)
         self.assertEqual(in_stock_products[0]["id"], "p1")
         self.assertEqual(in_stock_products[1]["id"], "p3")
 
         # Calculate total inventory value
-        total_value = dd(data).products[...](filter_in_stock)(calculate_value)
+        total_value = in_stock(calculate_value)
         self.assertEqual(total_value, 100 * 5 + 150 * 10)
 
         # Test further processing of transformed results
-        formatted_result = dd(data).products[...](filter_in_stock)(
-            lambda products: {p["id"]: f"${p['price'] * p['stock']}" for p in products}
-        )
+        formatted_result = in_stock(lambda products: {p["id"]: f"${p['price'] * p['stock']}" for p in products})
         self.assertEqual(formatted_result, {"p1": "$500", "p3": "$1500"})
 
     def test_conditional_data_access(self):
@@ -498,72 +722,64 @@ class TestDataDot(unittest.TestCase):
         # Dynamically build access paths
         tables = ["users", "posts"]
 
-        all_items = []
-        for table in tables:
-            items = dd(data).database.tables[table][...]()
-            all_items.extend(items)
+        base = dd(data).database.tables
+        all_items = [item for table in tables for item in base[table][...]()]
 
         self.assertEqual(len(all_items), 4)
 
         # Test building more complex dynamic access paths
-        def access_by_path(data, path_parts):
-            result = dd(data)
-            for part in path_parts:
-                if isinstance(part, int):
-                    result = result[part]
-                elif part == "...":
-                    result = result[...]
-                else:
-                    result = getattr(result, part)
-            return result()
+        # A built chain never changes, so shared prefixes such as database.tables are resolved once
+        @lru_cache(maxsize=None)
+        def resolve(prefix):
+            if not prefix:
+                return dd(data)
+            parent, part = resolve(prefix[:-1]), prefix[-1]
+            if isinstance(part, int):
+                return parent[part]
+            elif part == "...":
+                return parent[...]
+            else:
+                return getattr(parent, part)
+
+        def access_by_path(path_parts):
+            return resolve(path_parts)()
 
         # Dynamically build different access paths
-        user_names = access_by_path(data, ["database", "tables", "users", "...", "name"])
+        user_names = access_by_path(("database", "tables", "users", "...", "name"))
         self.assertEqual(user_names, ["Alice", "Bob"])
 
-        post_titles = access_by_path(data, ["database", "tables", "posts", "...", "title"])
+        post_titles = access_by_path(("database", "tables", "posts", "...", "title"))
         self.assertEqual(post_titles, ["Hello", "World"])
 
     def test_performance_with_complex_operations(self):
         """Test performance with complex operations"""
         import time
 
-        # Create a large data structure
-        data = {
-            "records": [
-                {
-                    "id": i,
-                    "values": [j for j in range(100)],
-                    "metadata": {
-                        "tags": [f"tag{k}" for k in range(20)],
-                        "created": "2023-01-01",
-                        "updated": "2023-01-02",
-                    },
-                }
-                for i in range(100)
-            ]
-        }
+        data = self._PERF_RECORDS
+
+        # Both operations below start from the same expansion, built once
+        records = dd(data).records[...]
 
         # Test performance of multiple expansions and filtering operations
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Complex operation: get the first tag of all records with even IDs
-        result = dd(data).records[...](lambda records: [r["metadata"]["tags"][0] for r in records if r["id"] % 2 == 0])
+        result = records(lambda records: [r["metadata"]["tags"][0] for r in records if r["id"] % 2 == 0])
 
-        end_time = time.time()
-        elapsed = end_time - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
 
         # Verify result correctness
         self.assertEqual(len(result), 50)  # 50 even IDs
         self.assertEqual(result[0], "tag0")
 
         # Performance check only as reference, not strict time assertion
-        print(f"Complex operation completed in {elapsed:.6f} seconds")
+        if _BENCH:
+            print(f"Complex operation completed in {elapsed_ns / 1e6:.3f} ms")
 
         # More complex operation: get average value and tag count for each record
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        result = dd(data).records[...](
+        result = records(
             lambda records: [
                 {
                     "id": r["id"],
@@ -574,15 +790,15 @@ class TestDataDot(unittest.TestCase):
             ]
         )
 
-        end_time = time.time()
-        elapsed = end_time - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
 
         # Verify results
         self.assertEqual(len(result), 100)
         self.assertEqual(result[0]["avg_value"], 49.5)  # Average of 0-99
         self.assertEqual(result[0]["tag_count"], 20)
 
-        print(f"More complex operation completed in {elapsed:.6f} seconds")
+        if _BENCH:
+            print(f"More complex operation completed in {elapsed_ns / 1e6:.3f} ms")
 
     def test_edge_cases(self):
         """Test various edge cases"""
@@ -606,43 +822,24 @@ class TestDataDot(unittest.TestCase):
             (1, 2): "tuple key",
         }
 
-        self.assertEqual(dd(data)["!@#$%^&*()"](), "special chars")
-        self.assertEqual(dd(data)["   "](), "spaces")
-        self.assertEqual(dd(data)[""](), "empty string")
-        self.assertEqual(dd(data)[123](), "numeric key")
-        self.assertEqual(dd(data)[True](), "boolean key")
-        self.assertEqual(dd(data)[(1, 2)](), "tuple key")
+        root = dd(data)
+        keys = ["!@#$%^&*()", "   ", "", 123, True, (1, 2)]
+        expected = ["special chars", "spaces", "empty string", "numeric key", "boolean key", "tuple key"]
+        self.assertListEqual([root[key]() for key in keys], expected)
 
         # Unicode and internationalization characters
         data = {"中文": "Chinese", "русский": "Russian", "日本語": "Japanese", "العربية": "Arabic", "😀": "Emoji"}
 
-        self.assertEqual(dd(data)["中文"](), "Chinese")
-        self.assertEqual(dd(data)["русский"](), "Russian")
-        self.assertEqual(dd(data)["日本語"](), "Japanese")
-        self.assertEqual(dd(data)["العربية"](), "Arabic")
-        self.assertEqual(dd(data)["😀"](), "Emoji")
+        root = dd(data)
+        self.assertEqual(root["中文"](), "Chinese")
+        self.assertEqual(root["русский"](), "Russian")
+        self.assertEqual(root["日本語"](), "Japanese")
+        self.assertEqual(root["العربية"](), "Arabic")
+        self.assertEqual(root["😀"](), "Emoji")
 
     def test_highly_nested_expansions(self):
         """Test highly nested expansion operations"""
-        # Create a deeply nested data structure
-        data = {
-            "level1": [
-                {
-                    "name": "A",
-                    "level2": [
-                        {"name": "A1", "level3": [{"name": "A1a", "value": 1}, {"name": "A1b", "value": 2}]},
-                        {"name": "A2", "level3": [{"name": "A2a", "value": 3}, {"name": "A2b", "value": 4}]},
-                    ],
-                },
-                {
-                    "name": "B",
-                    "level2": [
-                        {"name": "B1", "level3": [{"name": "B1a", "value": 5}, {"name": "B1b", "value": 6}]},
-                        {"name": "B2", "level3": None},  # Deliberately place a None
-                    ],
-                },
-            ]
-        }
+        data = self._NESTED_LEVELS
 
         # Test highly nested expansion - get all names from the deepest layer
         deepest_names = dd(data).level1[...].level2[...]._.level3[...]._.name()
@@ -651,9 +848,9 @@ class TestDataDot(unittest.TestCase):
 
         # Get all values and calculate sum
         all_values = dd(data).level1[...].level2[...]._.level3[...]._.value()
-        # Flatten and filter None
-        flat_values = [v for sublist1 in all_values for sublist2 in sublist1 for v in (sublist2 or [])]
-        self.assertEqual(sum(flat_values), 21)  # 1+2+3+4+5+6=21
+        # Sum each non-empty innermost list directly, no flattened copy
+        total = sum(sum(sub) for row in all_values for sub in row if sub)
+        self.assertEqual(total, 21)  # 1+2+3+4+5+6=21
 
         # Test applying transformations in multi-level expansions
         transformed = dd(data).level1[...].level2[...]._.level3[...].name()
@@ -661,22 +858,10 @@ class TestDataDot(unittest.TestCase):
         expected = [[["A1a", "A1b"], ["A2a", "A2b"]], [["B1a", "B1b"], []]]
         self.assertEqual(transformed, expected)
 
-        # Test flattening results after expansion
-        def flatten_nested_list(nested_list):
-            result = []
-
-            def _flatten(items):
-                for item in items:
-                    if isinstance(item, list):
-                        _flatten(item)
-                    else:
-                        result.append(item)
-
-            _flatten(nested_list)
-            return result
-
-        flattened_names = (
-            dd(data).level1[...].level2[...]._.level3[...]._.name(lambda names: flatten_nested_list(names))
+        # Test flattening results after expansion, the three levels are known so two chains suffice
+        # and the filter skips levels that came out None or empty
+        flattened_names = dd(data).level1[...].level2[...]._.level3[...]._.name(
+            lambda names: list(chain.from_iterable(filter(None, chain.from_iterable(names))))
         )
 
         self.assertEqual(flattened_names, ["A1a", "A1b", "A2a", "A2b", "B1a", "B1b"])